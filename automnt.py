@@ -1,22 +1,53 @@
 import subprocess
+import functools
+import itertools
 import json
 import os
-import getpass
+import logging
+import re
+import select
+import shutil
+import tempfile
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+
+try:
+    # orjson parses several times faster; fall back to the stdlib when it isn't installed
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 CONFIG_FILE = "config.json"
 PIDS_FILE = "pids.json"
 MOUNTS_FILE = "mounts.json"
-MOUNT_BASE_DIR = f"/home/{getpass.getuser()}/mounts"
+# expanduser reads $HOME and only falls back to a passwd lookup when it is unset
+MOUNT_BASE_DIR = os.path.join(os.path.expanduser("~"), "mounts")
 LOG_FILE = "automnt.log"
-
-# Default values for mount objects
-MOUNT_DEFAULTS = {
-    "options": [],
-    "auto_restart": False,
-    "description": "No description provided",
-    "enable": True
-}
+PROC_MOUNTS = "/proc/self/mounts"
+# An absolute executable path lets subprocess launch rclone with posix_spawn instead of fork+exec
+RCLONE = shutil.which("rclone") or "rclone"
+FUSERMOUNT = shutil.which("fusermount") or shutil.which("fusermount3") or "fusermount"
+# rclone's default --daemon-wait on Linux: the longest its launcher waits for the mount
+RCLONE_DAEMON_WAIT = 60
+
+# Seconds to wait for mount point probes before reporting them inactive
+PROBE_TIMEOUT = 1.0
+# Seconds the watchdog waits after a tracked mount leaves the mount table before re-checking it,
+# so that a stop issued from the CLI has time to land in the PIDS_FILE
+UNMOUNT_GRACE = 2.0
+
+# Parsed JSON files keyed by path: {path: (file_signature, value)}
+_cache = {}
+_cache_lock = threading.Lock()
+
+# The process umask; os.umask can only be read by setting it, so do that once at import
+_umask = os.umask(0)
+os.umask(_umask)
+
+# Name index for the currently cached mounts list: (mounts, {name: mount})
+_mounts_index = (None, {})
 
 # Default global configurations
 GLOBAL_DEFAULTS = {
@@ -29,16 +60,60 @@ GLOBAL_DEFAULTS = {
     "mount_base_dir": MOUNT_BASE_DIR
 }
 
-def log_message(message):
-    with open(LOG_FILE, "a") as log_file:
-        log_file.write(message + "\n")
+# The log file is opened once, on first use, and kept open for the life of the process
+logger = logging.getLogger("automnt")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_handler = logging.FileHandler(LOG_FILE, delay=True)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_log_handler)
+
+def log_message(message, level=logging.INFO):
+    logger.log(level, message)
+
+def set_log_level(level_name):
+    """
+    Apply the configured log_level, falling back to INFO for unknown names.
+    """
+    level = logging.getLevelName(str(level_name).upper())
+    logger.setLevel(level if isinstance(level, int) else logging.INFO)
+
+@dataclass(slots=True)
+class Mount:
+    """
+    A mount object from the MOUNTS_FILE. Optional fields missing from the file take the defaults below.
+    """
+    name: str
+    remote: dict
+    mount_point: str
+    options: list = field(default_factory=list)
+    auto_restart: bool = False
+    description: str = "No description provided"
+    enable: bool = True
+    # Keys this version doesn't know about, kept so that saving doesn't drop them
+    extra: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        known = {key: value for key, value in data.items() if key in MOUNT_FIELDS}
+        extra = {key: value for key, value in data.items() if key not in MOUNT_FIELDS}
+        for key in ("name", "remote", "mount_point"):
+            known.setdefault(key, None)
+        return cls(**known, extra=extra)
+
+    def to_dict(self):
+        data = {key: getattr(self, key) for key in MOUNT_FIELDS if getattr(self, key) is not None}
+        data.update(self.extra)
+        return data
+
+MOUNT_FIELDS = tuple(f.name for f in fields(Mount) if f.name != "extra")
 
 def is_valid_mount(mount):
     """
     Check if the mount has the minimum required information: valid remote and mount_point.
     """
-    remote = mount.get("remote", {})
-    mount_point = mount.get("mount_point")
+    remote = mount.remote
+    mount_point = mount.mount_point
 
     if not isinstance(remote, dict) or "name" not in remote or "type" not in remote:
         return False
@@ -47,121 +122,266 @@ def is_valid_mount(mount):
 
     return True
 
+def _file_signature(path):
+    """
+    Identify a file's current contents without reading it. Atomic saves replace the inode,
+    so the inode number catches rewrites that land within the filesystem's mtime granularity.
+    """
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+def _cached_json(path, default, prepare=None):
+    """
+    Load a JSON file, reusing the previously parsed value while the file is unchanged.
+    """
+    try:
+        signature = _file_signature(path)
+    except FileNotFoundError:
+        _invalidate_cache(path)
+        return default
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        with open(path, "rb") as file:
+            value = json_loads(file.read())
+        if prepare:
+            value = prepare(value)
+        _cache[path] = (signature, value)
+        return value
+
+def _invalidate_cache(path):
+    with _cache_lock:
+        _cache.pop(path, None)
+
+def _update_cache(path, value):
+    """
+    Record a just-written value so the next load doesn't re-parse the file.
+    """
+    with _cache_lock:
+        try:
+            _cache[path] = (_file_signature(path), value)
+        except OSError:
+            _cache.pop(path, None)
+
 def load_global_config():
     """
     Load the global configuration from the CONFIG_FILE.
     """
+    return _load_global_config_cached(_config_mtime_ns())
+
+def load_mount_command_builder():
+    """
+    Get a function (remote_name, mount_point, options) -> rclone mount argv
+    with the global default_options already baked in.
+    """
+    return _mount_command_builder_cached(_config_mtime_ns())
+
+def _config_mtime_ns():
+    try:
+        return os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _load_global_config_cached(mtime_ns):
+    """
+    Build the global configuration for a given CONFIG_FILE mtime, so it is only
+    parsed and merged with the defaults again once the file changes.
+    """
     global_config = GLOBAL_DEFAULTS.copy()
-    if os.path.exists(CONFIG_FILE):
+    if mtime_ns is not None:
         try:
-            with open(CONFIG_FILE, "r") as file:
-                config_data = json.load(file).get("global_config", {})
+            with open(CONFIG_FILE, "rb") as file:
+                config_data = json_loads(file.read()).get("global_config", {})
                 global_config.update(config_data)
         except (json.JSONDecodeError, FileNotFoundError) as e:
-            log_message(f"Error loading global config: {e}")
+            log_message(f"Error loading global config: {e}", logging.ERROR)
     return global_config
 
+@functools.lru_cache(maxsize=1)
+def _mount_command_builder_cached(mtime_ns):
+    default_options = _load_global_config_cached(mtime_ns).get("default_options", {})
+    common_args = ("--daemon", *itertools.chain.from_iterable(default_options.items()))
+
+    def build(remote_name, mount_point, options):
+        return [RCLONE, "mount", remote_name, mount_point, *common_args, *options]
+
+    return build
+
 def load_mounts():
     """
     Load the mount configuration from the MOUNTS_FILE.
     """
-    if os.path.exists(MOUNTS_FILE):
-        with open(MOUNTS_FILE, "r") as file:
-            mounts = json.load(file)
-            # Apply defaults to all mounts and validate minimum requirements
-            for mount in mounts:
-                for key, value in MOUNT_DEFAULTS.items():
-                    mount.setdefault(key, value)
-                if not is_valid_mount(mount):
-                    mount["enable"] = False
-                    log_message(f"Mount {mount.get('name', 'Unnamed')} disabled due to invalid configuration.")
-            return mounts
-    return []
+    return _cached_json(MOUNTS_FILE, [], _prepare_mounts)
+
+def load_mounts_by_name():
+    """
+    Load the mount configuration as a {name: mount} dict.
+    """
+    global _mounts_index
+    mounts = load_mounts()
+    if _mounts_index[0] is not mounts:
+        by_name = {}
+        for mount in mounts:
+            if mount.name is not None:
+                by_name.setdefault(mount.name, mount)
+        _mounts_index = (mounts, by_name)
+    return _mounts_index[1]
+
+def _prepare_mounts(mounts):
+    """
+    Build mount objects, applying defaults, and validate minimum requirements.
+    """
+    mounts = [Mount.from_dict(data) for data in mounts]
+    for mount in mounts:
+        if not is_valid_mount(mount):
+            mount.enable = False
+            log_message(f"Mount {mount.name or 'Unnamed'} disabled due to invalid configuration.", logging.WARNING)
+    return mounts
+
+def _write_json_atomic(path, data, fsync=False):
+    """
+    Write JSON to a temporary file next to path and rename it into place,
+    so a crash can never leave a truncated file behind.
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, "w") as file:
+            # mkstemp creates the file 0600; give it the mode open() would have
+            try:
+                mode = os.stat(path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o666 & ~_umask
+            os.fchmod(file.fileno(), mode)
+            json.dump(data, file, indent=4)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
 def save_mounts(mounts):
     """
     Save mount objects to the MOUNTS_FILE.
     """
+    global _mounts_index
     try:
-        with open(MOUNTS_FILE, "w") as file:
-            json.dump(mounts, file, indent=4)
+        _write_json_atomic(MOUNTS_FILE, [mount.to_dict() for mount in mounts], fsync=True)
     except IOError as e:
-        log_message(f"Error saving mounts: {e}")
+        _invalidate_cache(MOUNTS_FILE)
+        log_message(f"Error saving mounts: {e}", logging.ERROR)
+        return
+    _mounts_index = (None, {})
+    _update_cache(MOUNTS_FILE, mounts)
 
 def save_pids(pids):
-    with open(PIDS_FILE, "w") as file:
-        json.dump(pids, file, indent=4)
+    try:
+        # pids.json is runtime state that can be rebuilt, so skip the fsync
+        _write_json_atomic(PIDS_FILE, pids)
+    except IOError:
+        _invalidate_cache(PIDS_FILE)
+        raise
+    _update_cache(PIDS_FILE, pids)
 
 def load_pids():
-    try:
-        with open(PIDS_FILE, "r") as file:
-            return json.load(file)
-    except FileNotFoundError:
-        return {}
+    return _cached_json(PIDS_FILE, {})
 
 def resolve_mount(name):
     """
     Resolve a mount name to a mount object using the MOUNTS_FILE.
     """
-    mounts = load_mounts()
-    for mount in mounts:
-        if mount["name"] == name:
-            return mount
-    log_message(f"Mount '{name}' not found.")
-    return None
+    mount = load_mounts_by_name().get(name)
+    if mount is None:
+        log_message(f"Mount '{name}' not found.", logging.WARNING)
+    return mount
 
 def start_mount(mount):
     """
     Start an Rclone mount based on a mount object.
     """
-    if not mount.get("enable", True):
-        log_message(f"Mount {mount['name']} is disabled and will not be started.")
-        return
+    start_mounts([mount])
 
-    global_config = load_global_config()
-    default_options = global_config.get("default_options", {})
+def start_mounts(mounts):
+    """
+    Start several Rclone mounts, recording all of their PIDs with a single PIDS_FILE write.
+    """
+    build_command = load_mount_command_builder()
+    started = {}
+    try:
+        for mount in mounts:
+            if not mount.enable:
+                log_message(f"Mount {mount.name} is disabled and will not be started.")
+                continue
 
-    os.makedirs(mount["mount_point"], exist_ok=True)
-    command = ["rclone", "mount", mount["remote"]["name"], mount["mount_point"], "--daemon"]
+            os.makedirs(mount.mount_point, exist_ok=True)
+            command = build_command(mount.remote["name"], mount.mount_point, mount.options)
+
+            # Python's own fds are non-inheritable, so there is nothing for close_fds to clean up.
+            # Nothing reads rclone's output, so it must not go to pipes that can fill up and block it.
+            with open(f"{LOG_FILE}.{mount.name}.err", "ab") as err_log:
+                process = subprocess.Popen(
+                    command,
+                    stdout=subprocess.DEVNULL,
+                    stderr=err_log,
+                    close_fds=False
+                )
+            started[mount.name] = {
+                "pid": process.pid,
+                "mount_point": mount.mount_point,
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+            }
+            log_message(f"Started mount for {mount.name} (PID: {process.pid})")
+    finally:
+        # Record whatever did start, even if a later mount raised
+        if started:
+            save_pids({**load_pids(), **started})
 
-    # Add global default options
-    for option, value in default_options.items():
-        command.extend([option, value])
+def stop_mount(mount_name):
+    """
+    Stop a specific Rclone mount using its name.
+    """
+    stop_mnt(mount_name)
 
-    # Add mount-specific options
-    if "options" in mount:
-        command.extend(mount["options"])
+def _unmount(mount_point):
+    subprocess.run([FUSERMOUNT, "-u", mount_point], check=False, close_fds=False)
 
-    process = subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    pids = load_pids()
-    pids[mount["name"]] = {
-        "pid": process.pid,
-        "mount_point": mount["mount_point"],
-        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-    }
-    save_pids(pids)
-    log_message(f"Started mount for {mount['name']} (PID: {process.pid})")
+def _process_alive(pid):
+    """
+    Check whether a process is still running with a signal-0 kill(2), without touching the filesystem.
+    Our own exited children are reaped first so they don't linger as zombies that look alive.
+    """
+    try:
+        if os.waitpid(pid, os.WNOHANG)[0] == pid:
+            return False
+    except ChildProcessError:
+        pass
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
 
-def stop_mount(mount_name):
+def _mount_starting(pid_entry):
     """
-    Stop a specific Rclone mount using its name.
+    Check whether rclone's --daemon launcher for a pids.json entry is still waiting for its mount.
+    The launcher exits once the mount is ready, so this only holds for a freshly started mount.
     """
-    pids = load_pids()
-    if mount_name in pids:
-        pid = pids[mount_name]["pid"]
-        mount_point = pids[mount_name]["mount_point"]
-        try:
-            os.kill(pid, 15)  # SIGTERM
-            log_message(f"Stopped mount for {mount_name} (PID: {pid})")
-        except ProcessLookupError:
-            log_message(f"Process {pid} not found for {mount_name}. Cleaning up.")
-        subprocess.run(["fusermount", "-u", mount_point], check=False)
-        del pids[mount_name]
-        save_pids(pids)
+    try:
+        started = time.mktime(time.strptime(pid_entry["timestamp"], "%Y-%m-%d %H:%M:%S"))
+    except (KeyError, ValueError):
+        return False
+    return time.time() - started < RCLONE_DAEMON_WAIT and _process_alive(pid_entry["pid"])
 
 def validate_mount(mount_point):
     """
@@ -169,67 +389,195 @@ def validate_mount(mount_point):
     """
     return os.path.ismount(mount_point)
 
+def probe_mounts(mount_points, timeout=PROBE_TIMEOUT):
+    """
+    Validate several mount points concurrently so one hung mount can't stall the rest.
+    Probes that haven't finished within the timeout count as invalid. They run in daemon
+    threads, so a probe stuck on a dead FUSE mount can't keep the process from exiting.
+    """
+    results = {}
+
+    def probe(mount_point):
+        results[mount_point] = validate_mount(mount_point)
+
+    threads = [threading.Thread(target=probe, args=(mp,), daemon=True) for mp in mount_points]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        thread.join(max(0, deadline - time.monotonic()))
+    return {mp: results.get(mp, False) for mp in mount_points}
+
 def start_mnt(*mount_names):
     """
     Start one or more mounts by their names.
     """
-    for name in mount_names:
-        mount = resolve_mount(name)
-        if mount:
-            start_mount(mount)
+    mounts = [resolve_mount(name) for name in mount_names]
+    start_mounts([mount for mount in mounts if mount])
 
 def stop_mnt(*mount_names):
     """
     Stop one or more mounts by their names.
+    The PIDS_FILE is rewritten once, before anything is torn down, so the watchdog never sees
+    a tracked mount disappear. Then all processes are signalled and the mount points are
+    unmounted in parallel.
     """
-    for name in mount_names:
-        stop_mount(name)
+    pids = load_pids()
+    stopping = [name for name in dict.fromkeys(mount_names) if name in pids]
+    if not stopping:
+        return
+
+    save_pids({name: entry for name, entry in pids.items() if name not in stopping})
+
+    for name in stopping:
+        pid = pids[name]["pid"]
+        try:
+            os.kill(pid, 15)  # SIGTERM
+            log_message(f"Stopped mount for {name} (PID: {pid})")
+        except ProcessLookupError:
+            log_message(f"Process {pid} not found for {name}. Cleaning up.", logging.WARNING)
+
+    mount_points = [pids[name]["mount_point"] for name in stopping]
+    with ThreadPoolExecutor(max_workers=min(32, len(mount_points))) as executor:
+        list(executor.map(_unmount, mount_points))
 
 def mnt_status(mnt_name=None):
     """
     Get the status of all mounts or a specific mount.
     """
-    mounts = load_mounts()
+    if mnt_name:
+        mount = resolve_mount(mnt_name)
+        if not mount:
+            return {mnt_name: "Not Found"}
+        mounts = [mount]
+    else:
+        mounts = load_mounts()
     pids = load_pids()
 
+    probes = probe_mounts({
+        pids[m.name]["mount_point"]
+        for m in mounts
+        if m.enable and m.name in pids
+    })
+
     def get_status(mount):
-        name = mount["name"]
-        if not mount.get("enable", True):
+        name = mount.name
+        if not mount.enable:
             return "Disabled"
         elif name in pids:
-            return "Active" if validate_mount(pids[name]["mount_point"]) else "Inactive"
+            return "Active" if probes[pids[name]["mount_point"]] else "Inactive"
         return "Not Mounted"
 
     if mnt_name:
-        mount = resolve_mount(mnt_name)
-        if mount:
-            return {mnt_name: get_status(mount)}
-        else:
-            return {mnt_name: "Not Found"}
+        return {mnt_name: get_status(mount)}
     else:
-        return {m["name"]: get_status(m) for m in mounts}
+        return {m.name: get_status(m) for m in mounts}
+
+def _open_mount_table():
+    """
+    Open the kernel mount table for change notifications, or return None if it isn't available.
+    """
+    try:
+        table = open(PROC_MOUNTS, "r")
+    except OSError:
+        return None
+    poller = select.poll()
+    poller.register(table, select.POLLPRI)
+    return table, poller
+
+def _read_mount_points(mount_table):
+    """
+    Read the set of currently mounted paths from the kernel mount table.
+    """
+    table, _ = mount_table
+    table.seek(0)
+    return {
+        re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), line.split()[1])
+        for line in table
+    }
+
+def _wait_for_mount_change(mount_table, timeout):
+    """
+    Block until something is mounted or unmounted, or the timeout expires.
+    Returns the new set of mounted paths, or None on timeout.
+    """
+    _, poller = mount_table
+    if not poller.poll(timeout * 1000):
+        return None
+    return _read_mount_points(mount_table)
 
 def watchdog():
     """
     Monitor all active mounts and restart failed ones if auto_restart is enabled.
+    Re-validates every mount point each watchdog_interval to catch mounts whose rclone process
+    died without unmounting. Mount table changes bring the next check forward to UNMOUNT_GRACE
+    seconds after a tracked mount disappears, instead of acting on the event itself. Mount points
+    that were validated less than half an interval ago are skipped on such early checks, and
+    looked at again once that validation is a full interval old.
     """
     global_config = load_global_config()
     interval = global_config.get("watchdog_interval", 10)
+    mount_table = _open_mount_table()
 
     log_message("Watchdog started.")
+    # Monotonic time of each mount's last successful validation
+    last_ok = {}
+    # Check everything straight away, so mounts that are already dead get restarted at startup
+    next_check = time.monotonic()
+    active = True
     while True:
+        timeout = max(0, next_check - time.monotonic())
+        mounted = None
+        if active and mount_table:
+            mounted = _wait_for_mount_change(mount_table, timeout)
+        else:
+            time.sleep(timeout)
+
+        now = time.monotonic()
         pids = load_pids()
-        mounts = load_mounts()
-        for mount in mounts:
-            if not mount.get("enable", True):
+        active = [m for m in load_mounts() if m.enable and m.name in pids]
+        if mounted is not None:
+            # An unmount may be a stop that hasn't reached the PIDS_FILE yet, so rather than
+            # restart here, check the dropped mounts again once pids have had time to settle
+            dropped = [
+                m for m in active
+                if os.path.abspath(pids[m.name]["mount_point"]) not in mounted
+            ]
+            for mount in dropped:
+                last_ok.pop(mount.name, None)
+            if dropped:
+                next_check = min(next_check, now + UNMOUNT_GRACE)
+            continue
+
+        next_check = now + interval
+        candidates = []
+        for mount in active:
+            checked = last_ok.get(mount.name)
+            if checked is not None and max(0, now - checked) < interval / 2:
+                # Skip it this time, but come back before its last validation is an interval old
+                next_check = min(next_check, checked + interval)
+            else:
+                candidates.append(mount)
+
+        # Cheap kill(2) first: a mount that is still coming up has nothing to stat yet
+        candidates = [m for m in candidates if not _mount_starting(pids[m.name])]
+        # Bounded, concurrent stats: a hung FUSE endpoint counts as failed instead of
+        # blocking the watchdog and every other mount with it
+        probes = probe_mounts({pids[m.name]["mount_point"] for m in candidates})
+
+        restarts = []
+        for mount in candidates:
+            name = mount.name
+            if probes[pids[name]["mount_point"]]:
+                last_ok[name] = now
                 continue
-            if mount["name"] in pids and not validate_mount(pids[mount["name"]]["mount_point"]):
-                if mount.get("auto_restart", False):
-                    log_message(f"Mount {mount['name']} failed. Restarting...")
-                    start_mount(mount)
-                else:
-                    log_message(f"Mount {mount['name']} failed. Auto-restart disabled.")
-        time.sleep(interval)
+            if mount.auto_restart:
+                log_message(f"Mount {name} failed. Restarting...", logging.WARNING)
+                restarts.append(mount)
+            else:
+                log_message(f"Mount {name} failed. Auto-restart disabled.", logging.WARNING)
+
+        start_mounts(restarts)
 
 def import_mounts_from_rclone():
     """
@@ -237,33 +585,36 @@ def import_mounts_from_rclone():
     """
     try:
         result = subprocess.run(
-            ["rclone", "listremotes"],
+            [RCLONE, "listremotes", "--long"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
             check=True
         )
-        remotes = result.stdout.strip().split("\n")
-        mounts = load_mounts()
-        for remote in remotes:
-            if remote:  # Ensure it's not an empty line
-                mount_name = remote.strip(":")
-                mount_point = os.path.join(MOUNT_BASE_DIR, mount_name)
-                mount = {
-                    "name": mount_name,
-                    "remote": {"name": remote, "type": "unknown"},
-                    "mount_point": mount_point,
-                    "options": [],
-                    "auto_restart": False,
-                    "description": f"Imported mount for {remote}",
-                    "enable": True
-                }
-                if not any(m["name"] == mount_name for m in mounts):
-                    mounts.append(mount)
-        save_mounts(mounts)
+        # Each line is "<remote>:  <type>", possibly followed by a description. Remote names
+        # can't contain ":", so split on that rather than on whitespace.
+        remotes = []
+        for line in result.stdout.splitlines():
+            if line.strip():
+                name, _, rest = line.partition(":")
+                parts = rest.split()
+                remotes.append((name, parts[0] if parts else "unknown"))
+        existing_names = load_mounts_by_name()
+        imported = [
+            Mount(
+                name=name,
+                remote={"name": f"{name}:", "type": remote_type},
+                mount_point=os.path.join(MOUNT_BASE_DIR, name),
+                description=f"Imported mount for {name}:"
+            )
+            for name, remote_type in remotes
+            if name not in existing_names
+        ]
+        # Build a new list so the cached mounts are never modified in place
+        save_mounts([*load_mounts(), *imported])
         log_message("Mounts imported successfully from Rclone.")
     except subprocess.CalledProcessError as e:
-        log_message(f"Error importing mounts from Rclone: {e.stderr}")
+        log_message(f"Error importing mounts from Rclone: {e.stderr}", logging.ERROR)
 
 def cli():
     import sys
@@ -272,18 +623,17 @@ def cli():
         return
 
     action = sys.argv[1]
+    set_log_level(load_global_config().get("log_level", "INFO"))
     target = sys.argv[2:] if len(sys.argv) > 2 else []
 
     if action == "start":
         if "all" in target:
-            for mount in load_mounts():
-                start_mount(mount)
+            start_mounts(load_mounts())
         else:
             start_mnt(*target)
     elif action == "stop":
         if "all" in target:
-            for mount_name in list(load_pids().keys()):
-                stop_mount(mount_name)
+            stop_mnt(*load_pids())
         else:
             stop_mnt(*target)
     elif action == "watchdog":